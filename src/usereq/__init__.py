@@ -12,6 +12,7 @@ from __future__ import annotations
 import importlib
 from . import compress  # usereq.compress submodule
 from . import compress_files  # usereq.compress_files submodule
+from . import construct_cache  # usereq.construct_cache submodule
 from . import find_constructs  # usereq.find_constructs submodule
 from . import generate_markdown  # usereq.generate_markdown submodule
 from . import source_analyzer  # usereq.source_analyzer submodule
@@ -57,6 +58,6 @@ def __getattr__(name: str) -> Any:
 __all__ = [
     "__version__", "main", "cli",
     "source_analyzer", "token_counter", "generate_markdown",
-    "compress", "compress_files", "find_constructs",
+    "compress", "compress_files", "construct_cache", "find_constructs",
 ]
 """! @brief List of public symbols exported by the package."""
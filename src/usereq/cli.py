@@ -986,17 +986,26 @@ def cleanup_release_check_idle_state_cache(
     program_name: str = RELEASE_CHECK_PROGRAM_NAME,
 ) -> None:
     """!
-    @brief Delete release-check idle-state file and remove empty cache directory.
+    @brief Delete release-check idle-state and construct cache files and remove empty cache directory.
         @param program_name Program identifier used as cache subdirectory under `$HOME/.cache`.
         @throws OSError If filesystem operations fail.
-    @details Deletes `$HOME/.cache/<program_name>/check_version_idle-time.json` when present; removes `$HOME/.cache/<program_name>` only when it exists and has no remaining entries.
+    @details Deletes `$HOME/.cache/<program_name>/check_version_idle-time.json` and `$HOME/.cache/<program_name>/constructs.sqlite` (with its SQLite journal) when present; removes `$HOME/.cache/<program_name>` only when it exists and has no remaining entries.
     @satisfies SRS-346
     """
+    from .construct_cache import CONSTRUCT_CACHE_FILENAME
+
     idle_state_file_path = get_release_check_idle_file_path(program_name=program_name)
     idle_state_cache_dir = idle_state_file_path.parent
+    # Same location as `construct_cache.get_construct_cache_path(program_name)`
+    construct_cache_path = idle_state_cache_dir / CONSTRUCT_CACHE_FILENAME
 
-    if idle_state_file_path.exists():
-        idle_state_file_path.unlink()
+    for cache_file_path in (
+        idle_state_file_path,
+        construct_cache_path,
+        construct_cache_path.with_name(f"{construct_cache_path.name}-journal"),
+    ):
+        if cache_file_path.exists():
+            cache_file_path.unlink()
 
     if (
         idle_state_cache_dir.exists()
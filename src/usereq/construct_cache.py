@@ -0,0 +1,257 @@
+"""!
+@file construct_cache.py
+@brief Persistent cache of analyzed source elements keyed by file content.
+@details Stores pickled `SourceAnalyzer.analyze()` + `enrich()` results in `$HOME/.cache/usereq/constructs.sqlite`, one row per (absolute file path, language), validated against the SHA-256 of the source text and a signature of the analyzer modules. Unchanged files skip parsing on later runs; edits replace the file's row, any change to the analyzer code invalidates existing entries, and `prune_cached_elements()` evicts rows for vanished files and caps the total payload size. Cache failures are never fatal: lookups miss and stores are dropped.
+@author GitHub Copilot
+@version 0.0.70
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from functools import lru_cache
+from pathlib import Path
+
+CONSTRUCT_CACHE_PROGRAM_NAME = "usereq"
+"""! @brief Program identifier used as cache subdirectory under `$HOME/.cache`."""
+
+CONSTRUCT_CACHE_ROOT_DIRNAME = ".cache"
+"""! @brief Root cache directory name located under `$HOME`."""
+
+CONSTRUCT_CACHE_FILENAME = "constructs.sqlite"
+"""! @brief SQLite database filename holding cached analyzer results."""
+
+_ANALYZER_MODULES = ("source_analyzer.py", "doxygen_parser.py")
+"""! @brief Package modules whose content determines analyzer output."""
+
+CONSTRUCT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+"""! @brief Upper bound on the total pickled payload kept in the cache database."""
+
+_LAST_USED_REFRESH_SECONDS = 3600
+"""! @brief Minimum age of `last_used` before a cache hit rewrites it."""
+
+_SCHEMA_VERSION = 3
+"""! @brief Database schema version stored in `PRAGMA user_version`."""
+
+_pruned_cache_paths: set[str] = set()
+"""! @brief Cache databases already pruned by `prune_cached_elements()` in this process."""
+
+
+def get_construct_cache_path(
+    program_name: str = CONSTRUCT_CACHE_PROGRAM_NAME,
+) -> Path:
+    """! @brief Resolve the construct cache database path.
+    @param program_name Program identifier used as cache subdirectory under `$HOME/.cache`.
+    @return Absolute path `$HOME/.cache/<program_name>/constructs.sqlite`.
+    @details Builds the path using the effective home directory returned by `Path.home()`.
+    """
+    return (
+        Path.home()
+        / CONSTRUCT_CACHE_ROOT_DIRNAME
+        / program_name
+        / CONSTRUCT_CACHE_FILENAME
+    )
+
+
+@lru_cache(maxsize=1)
+def analyzer_signature() -> str:
+    """! @brief Compute a signature identifying the current analyzer implementation.
+    @return Hex SHA-256 digest over the analyzer module sources.
+    @details Hashes the bytes of `_ANALYZER_MODULES` in order, so editing or upgrading the analyzer invalidates every cached entry without manual version bumps. Computed once per process.
+    """
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).resolve().parent
+    for module_name in _ANALYZER_MODULES:
+        digest.update(module_name.encode("utf-8"))
+        digest.update((package_dir / module_name).read_bytes())
+    return digest.hexdigest()
+
+
+def content_digest(source_text: str) -> str:
+    """! @brief Hash source text for cache lookup and storage.
+    @param source_text Complete file content read in text mode.
+    @return Hex SHA-256 digest of the UTF-8 encoded text.
+    @details Callers compute it once per file and pass it to both `load_cached_elements()` and `store_cached_elements()`.
+    """
+    return hashlib.sha256(source_text.encode("utf-8")).hexdigest()
+
+
+def _connect(cache_path: Path) -> sqlite3.Connection:
+    """! @brief Open the cache database, creating directory and schema when missing.
+    @param cache_path Database file path.
+    @return Open SQLite connection in autocommit mode.
+    @throws OSError If the cache directory cannot be created.
+    @throws sqlite3.Error If the database cannot be opened or initialized.
+    @details Tracks the schema with `PRAGMA user_version`; a database written with another schema is dropped and recreated inside an immediate transaction so concurrent workers initialize it only once.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(cache_path), timeout=5.0, isolation_level=None)
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                    conn.execute("DROP TABLE IF EXISTS elements")
+                    conn.execute(
+                        "CREATE TABLE elements ("
+                        "file_path TEXT NOT NULL, "
+                        "language TEXT NOT NULL, "
+                        "sha256 TEXT NOT NULL, "
+                        "analyzer_version TEXT NOT NULL, "
+                        "pickled_elements BLOB NOT NULL, "
+                        "last_used REAL NOT NULL, "
+                        "PRIMARY KEY (file_path, language))"
+                    )
+                    conn.execute(
+                        "CREATE INDEX elements_analyzer_version "
+                        "ON elements (analyzer_version)"
+                    )
+                    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def load_cached_elements(
+    source_digest: str,
+    language: str,
+    file_path: str,
+    cache_path: Path | None = None,
+) -> list | None:
+    """! @brief Return cached analyzer elements for a source file, if still valid.
+    @param source_digest SHA-256 of the file content from `content_digest()`.
+    @param language Normalized language identifier.
+    @param file_path Source file path; normalized to an absolute path for the key.
+    @param cache_path Optional database path; defaults to `get_construct_cache_path()`.
+    @return List of enriched SourceElement instances, or None on miss or any cache error.
+    @details Looks up the row for (absolute file path, language) and returns it only when its content SHA-256 and analyzer version equal the current ones. On a hit, refreshes `last_used` when it is older than `_LAST_USED_REFRESH_SECONDS`, so frequently used rows survive size-based eviction without a write on every lookup. A missing database is a miss and is not created.
+    """
+    if cache_path is None:
+        cache_path = get_construct_cache_path()
+    if not cache_path.is_file():
+        return None
+    try:
+        key = (os.path.abspath(file_path), language)
+        conn = _connect(cache_path)
+        try:
+            row = conn.execute(
+                "SELECT sha256, analyzer_version, pickled_elements FROM elements "
+                "WHERE file_path = ? AND language = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            sha256, version, blob = row
+            if sha256 != source_digest or version != analyzer_signature():
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE elements SET last_used = ? "
+                "WHERE file_path = ? AND language = ? AND last_used < ?",
+                (now, *key, now - _LAST_USED_REFRESH_SECONDS),
+            )
+        finally:
+            conn.close()
+        return pickle.loads(blob)
+    except Exception:
+        return None
+
+
+def store_cached_elements(
+    source_digest: str,
+    language: str,
+    elements: list,
+    file_path: str,
+    cache_path: Path | None = None,
+) -> None:
+    """! @brief Persist analyzer elements for a source file.
+    @param source_digest SHA-256 of the file content from `content_digest()`.
+    @param language Normalized language identifier.
+    @param elements Enriched SourceElement instances to cache.
+    @param file_path Source file path; normalized to an absolute path for the key.
+    @param cache_path Optional database path; defaults to `get_construct_cache_path()`.
+    @return None.
+    @details Replaces the single row kept per (absolute file path, language), so the database holds at most one entry per analyzed file regardless of how often it is edited, and stamps it with the current `last_used` time. Eviction is left to `prune_cached_elements()`. Errors are swallowed.
+    """
+    if cache_path is None:
+        cache_path = get_construct_cache_path()
+    try:
+        version = analyzer_signature()
+        blob = pickle.dumps(elements, protocol=pickle.HIGHEST_PROTOCOL)
+        conn = _connect(cache_path)
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO elements "
+                "(file_path, language, sha256, analyzer_version, pickled_elements, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    os.path.abspath(file_path),
+                    language,
+                    source_digest,
+                    version,
+                    blob,
+                    time.time(),
+                ),
+            )
+        finally:
+            conn.close()
+    except Exception:
+        pass
+
+
+def prune_cached_elements(
+    cache_path: Path | None = None,
+    max_bytes: int = CONSTRUCT_CACHE_MAX_BYTES,
+) -> None:
+    """! @brief Evict stale, orphaned, and least recently used cache rows.
+    @param cache_path Optional database path; defaults to `get_construct_cache_path()`.
+    @param max_bytes Maximum total size of pickled payloads to keep.
+    @return None.
+    @details Runs at most once per database in each process, inside one immediate transaction: deletes rows written by other analyzer versions, then rows whose `file_path` no longer exists (deleted or moved files, removed worktrees and temporary checkouts), then the least recently used rows until the remaining payload fits in `max_bytes`. A missing database is left uncreated. Errors are swallowed.
+    """
+    if cache_path is None:
+        cache_path = get_construct_cache_path()
+    prune_key = str(cache_path)
+    if prune_key in _pruned_cache_paths:
+        return
+    _pruned_cache_paths.add(prune_key)
+    if not cache_path.is_file():
+        return
+    try:
+        conn = _connect(cache_path)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "DELETE FROM elements WHERE analyzer_version != ?",
+                    (analyzer_signature(),),
+                )
+                missing = [
+                    (path,)
+                    for (path,) in conn.execute("SELECT DISTINCT file_path FROM elements")
+                    if not os.path.isfile(path)
+                ]
+                conn.executemany("DELETE FROM elements WHERE file_path = ?", missing)
+                conn.execute(
+                    "DELETE FROM elements WHERE rowid IN ("
+                    "SELECT rowid FROM ("
+                    "SELECT rowid, SUM(LENGTH(pickled_elements)) "
+                    "OVER (ORDER BY last_used DESC, rowid DESC) AS kept_bytes "
+                    "FROM elements) WHERE kept_bytes > ?)",
+                    (max_bytes,),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+    except Exception:
+        pass
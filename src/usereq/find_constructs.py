@@ -7,15 +7,27 @@
 @version 0.0.70
 """
 
+import mmap
 import os
 import re
 import sys
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
+from . import construct_cache
 from .doxygen_parser import format_doxygen_fields_as_markdown, parse_doxygen_comment
 from .source_analyzer import SourceAnalyzer
 from .compress import compress_source, detect_language
 
 
+# Minimum number of input files before per-file analysis is distributed over a
+# process pool; below this, worker startup costs more than it saves.
+_PARALLEL_MIN_FILES = 3
+
+# Leading run of ASCII identifier characters, optionally after a `^` anchor.
+_LITERAL_PREFIX_RE = re.compile(r"\^?([A-Za-z0-9_]+)")
+
 # ── Language-specific TAG support map ────────────────────────────────────────
 LANGUAGE_TAGS = {
     "python": {"CLASS", "FUNCTION", "DECORATOR", "IMPORT", "VARIABLE"},
@@ -75,22 +87,54 @@ def language_supports_tags(lang: str, tag_set: set[str]) -> bool:
     return bool(supported & tag_set)
 
 
-def construct_matches(element, tag_set: set[str], pattern: str) -> bool:
+def construct_matches(element, tag_set: set[str], compiled: re.Pattern) -> bool:
     """! @brief Check if a source element matches tag filter and regex pattern.
     @param element SourceElement instance from analyzer.
     @param tag_set Set of requested TAG identifiers.
-    @param pattern Regex pattern string to test against element name.
+    @param compiled Precompiled regex pattern to test against element name.
     @return True if element type is in tag_set and name matches pattern.
-    @details Validates the element type and then applies the regex search on the element name.
+    @details Validates the element type and then applies the precompiled regex search on the element name.
     """
     if element.type_label not in tag_set:
         return False
     if not element.name:
         return False
-    try:
-        return bool(re.search(pattern, element.name))
-    except re.error:
-        return False
+    return bool(compiled.search(element.name))
+
+
+def _extract_literal_prefix(compiled: re.Pattern) -> str | None:
+    """! @brief Extract a literal that every name matched by the pattern must contain.
+    @param compiled Precompiled construct name pattern.
+    @return Leading ASCII identifier literal of the pattern, or None when no safe literal exists.
+    @details Takes the leading run of `[A-Za-z0-9_]` characters (after an optional `^`), dropping its last character when followed by an optional quantifier (`?`, `*`, `{`). Returns None for case-insensitive patterns and for patterns containing `|`, where the prefix is not guaranteed to be part of every match. Construct names are verbatim substrings of the source text, so a file whose raw bytes lack this literal cannot produce a match.
+    """
+    if compiled.flags & re.IGNORECASE or "|" in compiled.pattern:
+        return None
+    match = _LITERAL_PREFIX_RE.match(compiled.pattern)
+    if not match:
+        return None
+    literal = match.group(1)
+    if compiled.pattern[match.end():match.end() + 1] in ("?", "*", "{"):
+        literal = literal[:-1]
+    return literal or None
+
+
+def _file_contains_literal(fpath: str, literal: str) -> bool:
+    """! @brief Check whether a file's raw bytes contain an ASCII literal.
+    @param fpath Source file path.
+    @param literal ASCII literal to search for.
+    @return True if the literal occurs in the file or the file cannot be mapped, False otherwise.
+    @throws OSError If the file cannot be opened.
+    @details Memory-maps the file read-only and uses `mmap.find()` so the search runs in C without decoding the file or materializing its content. ASCII bytes never occur inside UTF-8 multi-byte sequences, so the byte search is equivalent to a search on the decoded text. When mapping fails (special files, filesystems without mmap support, files truncated after `fstat()`), reports a possible match so the file goes through the normal read and analysis.
+    """
+    with open(fpath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(literal.encode("ascii")) != -1
+        except (OSError, ValueError):
+            return True
 
 
 def _merge_doxygen_fields(
@@ -171,7 +215,7 @@ def _strip_construct_comments(
     @param line_start Absolute start line number of the construct in the original file.
     @param include_line_numbers If True, emit `<n>:` prefixes with absolute source line numbers.
     @return Comment-stripped construct code string.
-    @details Delegates comment stripping to `compress_source()` to remove inline, single-line, and multi-line comments while preserving string literals. When line numbers are enabled, remaps local compressed line indices back to absolute file line numbers using `line_start`.
+    @details Delegates comment stripping to `compress_source()` to remove inline, single-line, and multi-line comments while preserving string literals. When line numbers are enabled, remaps local compressed line indices back to absolute file line numbers using `line_start`, splitting each `<n>: ` prefix with `str.partition()` instead of a regex match.
     """
     raw_source = "".join(code_lines)
     stripped_with_local_numbers = compress_source(
@@ -183,31 +227,83 @@ def _strip_construct_comments(
 
     if not include_line_numbers:
         return "\n".join(
-            line.split(": ", 1)[1] if ": " in line else line
-            for line in stripped_lines
+            text if sep else prefix
+            for prefix, sep, text in (line.partition(": ") for line in stripped_lines)
         )
 
     remapped_lines: list[str] = []
     for line in stripped_lines:
-        match = re.match(r"^(\d+):\s(.*)$", line)
-        if not match:
+        local_line, sep, text = line.partition(": ")
+        if not sep or not local_line.isdecimal():
             remapped_lines.append(line)
             continue
-        local_line = int(match.group(1))
-        absolute_line = line_start + local_line - 1
-        remapped_lines.append(f"{absolute_line}: {match.group(2)}")
+        absolute_line = line_start + int(local_line) - 1
+        remapped_lines.append(f"{absolute_line}: {text}")
     return "\n".join(remapped_lines)
 
 
+class _SourceText:
+    """! @brief Read-only line view over a source file held as a single string.
+    @details Supports the `source_lines[start:stop]` slicing used by `format_construct()` without materializing one string per file line: line start offsets are discovered lazily with `str.find()` only up to the highest requested line, and only the requested range is split into lines. Lines keep their trailing newline, matching `readlines()` semantics.
+    """
+
+    def __init__(self, text: str):
+        """! @brief Wrap the full source text.
+        @param text Complete file content read in text mode.
+        @return None.
+        """
+        self._text = text
+        self._line_offsets = [0]
+
+    def _line_offset(self, index: int) -> int:
+        """! @brief Return the character offset where line `index` (0-based) starts.
+        @param index Zero-based line index.
+        @return Start offset, or the text length when `index` is past the last line.
+        """
+        text = self._text
+        offsets = self._line_offsets
+        while len(offsets) <= index:
+            last = offsets[-1]
+            if last >= len(text):
+                return len(text)
+            newline = text.find("\n", last)
+            offsets.append(len(text) if newline < 0 else newline + 1)
+        return offsets[index]
+
+    def _split(self, chunk: str) -> list[str]:
+        """! @brief Split a text chunk into newline-terminated lines like `readlines()`.
+        @param chunk Text slice to split.
+        @return Lines with trailing newlines; a final unterminated fragment is kept as-is.
+        @details Splits only on `\\n`, unlike `str.splitlines()`, so form feeds and other separators stay inside their line.
+        """
+        parts = chunk.split("\n")
+        lines = [part + "\n" for part in parts[:-1]]
+        if parts[-1]:
+            lines.append(parts[-1])
+        return lines
+
+    def __getitem__(self, key: slice) -> list[str]:
+        """! @brief Return the source lines selected by a slice.
+        @param key Line slice; non-negative bounds are resolved lazily, other slices fall back to a full split.
+        @return List of lines with trailing newlines preserved.
+        """
+        start = 0 if key.start is None else key.start
+        stop = key.stop
+        if start < 0 or (stop is not None and stop < 0) or key.step not in (None, 1):
+            return self._split(self._text)[key]
+        end = len(self._text) if stop is None else self._line_offset(stop)
+        return self._split(self._text[self._line_offset(start):end])
+
+
 def format_construct(
     element,
-    source_lines: list[str],
+    source_lines: list[str] | _SourceText,
     include_line_numbers: bool,
     language: str = "python",
 ) -> str:
     """! @brief Format a single matched construct for markdown output with complete code extraction.
     @param element SourceElement instance containing line range indices.
-    @param source_lines Complete source file content as list of lines.
+    @param source_lines Complete source file content as list of lines, or a `_SourceText` line view.
     @param include_line_numbers If True, prefix code lines with <n>: format.
     @param language Normalized source language key used for comment stripping.
     @return Formatted markdown block for the construct with complete code from line_start to line_end.
@@ -241,6 +337,93 @@ def format_construct(
     return "\n".join(lines)
 
 
+def _find_constructs_in_file(
+    fpath: str,
+    tag_set: set[str],
+    compiled: re.Pattern,
+    include_line_numbers: bool,
+    required_literal: str | None = None,
+    cache_path: Path | None = None,
+) -> tuple[str | None, int, str, str]:
+    """! @brief Analyze one source file and render its matching constructs.
+    @param fpath Source file path.
+    @param tag_set Set of requested TAG identifiers.
+    @param compiled Precompiled regex pattern for construct name matching.
+    @param include_line_numbers If True, prefix code lines with <n>: format.
+    @param required_literal Optional literal from `_extract_literal_prefix()`; files whose bytes lack it are skipped before reading or analysis.
+    @param cache_path Construct cache database path resolved by the caller; None disables the cache.
+    @return Tuple (markdown block or None, match count, status, detail) where status is one of `OK`, `SKIP`, `FAIL`.
+    @details Module-level so it can run inside worker processes; progress reporting is left to the caller using the returned status and detail. Analyzer results are loaded from and stored to the persistent construct cache at `cache_path`, keyed by file content.
+    """
+    if not os.path.isfile(fpath):
+        return None, 0, "SKIP", "not found"
+
+    lang = detect_language(fpath)
+    if not lang:
+        return None, 0, "SKIP", "unsupported extension"
+
+    # Check if language supports at least one requested tag
+    if not language_supports_tags(lang, tag_set):
+        return None, 0, "SKIP", f"language {lang} does not support any requested tags"
+
+    try:
+        # Cheap byte-level prefilter: skip files that cannot contain a matching name
+        if required_literal and not _file_contains_literal(fpath, required_literal):
+            return None, 0, "SKIP", "no matches"
+
+        # Read complete source file once; construct ranges are sliced on demand
+        with open(fpath, 'r', encoding='utf-8', errors='replace') as f:
+            source_text = f.read()
+        source_lines = _SourceText(source_text)
+
+        # Reuse analyzer output from previous runs when the content is unchanged
+        elements = None
+        if cache_path is not None:
+            source_digest = construct_cache.content_digest(source_text)
+            elements = construct_cache.load_cached_elements(
+                source_digest, lang, fpath, cache_path=cache_path
+            )
+        if elements is None:
+            analyzer = SourceAnalyzer()
+            elements = analyzer.analyze(fpath, lang)
+            analyzer.enrich(elements, lang, fpath)
+            if cache_path is not None:
+                construct_cache.store_cached_elements(
+                    source_digest, lang, elements, fpath, cache_path=cache_path
+                )
+
+        # Filter elements matching tag and pattern
+        matches = [el for el in elements if construct_matches(el, tag_set, compiled)]
+        if not matches:
+            return None, 0, "SKIP", "no matches"
+
+        header = f"@@@ {fpath} | {lang}"
+        file_level_doxygen_fields = _extract_file_level_doxygen_fields(elements)
+        file_level_doxygen_lines = []
+        if file_level_doxygen_fields:
+            file_level_doxygen_lines = format_doxygen_fields_as_markdown(
+                file_level_doxygen_fields
+            )
+        constructs_md = "\n\n".join(
+            format_construct(
+                el,
+                source_lines,
+                include_line_numbers,
+                language=lang,
+            )
+            for el in matches
+        )
+        if file_level_doxygen_lines:
+            file_level_block = "\n".join(file_level_doxygen_lines)
+            part = f"{header}\n{file_level_block}\n\n{constructs_md}"
+        else:
+            part = f"{header}\n\n{constructs_md}"
+        return part, len(matches), "OK", f"{len(matches)} matches"
+
+    except Exception as e:
+        return None, 0, "FAIL", str(e)
+
+
 def find_constructs_in_files(
     filepaths: list[str],
     tag_filter: str,
@@ -255,13 +438,58 @@ def find_constructs_in_files(
     @param include_line_numbers If True (default), prefix code lines with <n>: format.
     @param verbose If True, emits progress status messages on stderr.
     @return Concatenated markdown output string.
-    @throws ValueError If no files could be processed or no constructs found.
-    @details Analyzes each file with SourceAnalyzer, filters elements by tag and name pattern, formats results as markdown with file headers.
+    @throws ValueError If the tag filter is empty, the pattern is not a valid regex, or no constructs found.
+    @details Compiles the name pattern once and derives its required literal for a byte-level file prefilter, then analyzes each file with `_find_constructs_in_file()`. When at least `_PARALLEL_MIN_FILES` files are given and more than one CPU is available, files are distributed over a process pool; results are consumed lazily in input order, so progress messages stream per file and output stays deterministic. Falls back to serial processing only if the pool cannot be started, either for lack of OS resources (`OSError`) or because the platform lacks working named semaphores (`NotImplementedError`).
     """
     tag_set = parse_tag_filter(tag_filter)
     if not tag_set:
         available = format_available_tags()
         raise ValueError(f"No valid tags specified in tag filter.\n\nAvailable tags by language:\n{available}")
+    try:
+        compiled = re.compile(pattern)
+    except re.error as e:
+        available = format_available_tags()
+        raise ValueError(f"Invalid regex pattern '{pattern}': {e}\n\nAvailable tags by language:\n{available}")
+
+    required_literal = _extract_literal_prefix(compiled)
+    # Resolved here, not in workers, so spawned processes use the same database
+    cache_path = construct_cache.get_construct_cache_path()
+    construct_cache.prune_cached_elements(cache_path)
+
+    executor = None
+    results = None
+    max_workers = min(os.cpu_count() or 1, len(filepaths))
+    if len(filepaths) >= _PARALLEL_MIN_FILES and max_workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            # map() yields results lazily in input order as workers finish them
+            results = executor.map(
+                _find_constructs_in_file,
+                filepaths,
+                repeat(tag_set),
+                repeat(compiled),
+                repeat(include_line_numbers),
+                repeat(required_literal),
+                repeat(cache_path),
+                chunksize=4,
+            )
+        except (OSError, NotImplementedError):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            executor = None
+            results = None
+    if results is None:
+        results = (
+            _find_constructs_in_file(
+                fpath,
+                tag_set,
+                compiled,
+                include_line_numbers,
+                required_literal,
+                cache_path,
+            )
+            for fpath in filepaths
+        )
 
     parts = []
     ok_count = 0
@@ -269,74 +497,21 @@ def find_constructs_in_files(
     fail_count = 0
     total_matches = 0
 
-    for fpath in filepaths:
-        if not os.path.isfile(fpath):
-            if verbose:
-                print(f"  SKIP  {fpath} (not found)", file=sys.stderr)
-            skip_count += 1
-            continue
-
-        lang = detect_language(fpath)
-        if not lang:
-            if verbose:
-                print(f"  SKIP  {fpath} (unsupported extension)", file=sys.stderr)
-            skip_count += 1
-            continue
-
-        # Check if language supports at least one requested tag
-        if not language_supports_tags(lang, tag_set):
+    try:
+        for fpath, (part, match_count, status, detail) in zip(filepaths, results):
             if verbose:
-                print(f"  SKIP  {fpath} (language {lang} does not support any requested tags)", file=sys.stderr)
-            skip_count += 1
-            continue
-
-        try:
-            # Read complete source file for full construct extraction
-            with open(fpath, 'r', encoding='utf-8', errors='replace') as f:
-                source_lines = f.readlines()
-
-            analyzer = SourceAnalyzer()
-            elements = analyzer.analyze(fpath, lang)
-            analyzer.enrich(elements, lang, fpath)
-
-            # Filter elements matching tag and pattern
-            matches = [el for el in elements if construct_matches(el, tag_set, pattern)]
-
-            if matches:
-                header = f"@@@ {fpath} | {lang}"
-                file_level_doxygen_fields = _extract_file_level_doxygen_fields(elements)
-                file_level_doxygen_lines = []
-                if file_level_doxygen_fields:
-                    file_level_doxygen_lines = format_doxygen_fields_as_markdown(
-                        file_level_doxygen_fields
-                    )
-                constructs_md = "\n\n".join(
-                    format_construct(
-                        el,
-                        source_lines,
-                        include_line_numbers,
-                        language=lang,
-                    )
-                    for el in matches
-                )
-                if file_level_doxygen_lines:
-                    file_level_block = "\n".join(file_level_doxygen_lines)
-                    parts.append(f"{header}\n{file_level_block}\n\n{constructs_md}")
-                else:
-                    parts.append(f"{header}\n\n{constructs_md}")
-                total_matches += len(matches)
+                print(f"  {status:<6}{fpath} ({detail})", file=sys.stderr)
+            if status == "OK":
+                parts.append(part)
+                total_matches += match_count
                 ok_count += 1
-                if verbose:
-                    print(f"  OK    {fpath} ({len(matches)} matches)", file=sys.stderr)
-            else:
-                if verbose:
-                    print(f"  SKIP  {fpath} (no matches)", file=sys.stderr)
+            elif status == "SKIP":
                 skip_count += 1
-
-        except Exception as e:
-            if verbose:
-                print(f"  FAIL  {fpath} ({e})", file=sys.stderr)
-            fail_count += 1
+            else:
+                fail_count += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     if not parts:
         available = format_available_tags()
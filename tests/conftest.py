@@ -31,6 +31,17 @@ def temp_output_dir():
     return path
 
 
+@pytest.fixture(autouse=True)
+def isolated_construct_cache(monkeypatch, tmp_path):
+    """Cache dei costrutti vuota per ogni test, mai sotto $HOME/.cache."""
+    cache_path = tmp_path / "constructs.sqlite"
+    monkeypatch.setattr(
+        "usereq.construct_cache.get_construct_cache_path",
+        lambda program_name="usereq": cache_path,
+    )
+    return cache_path
+
+
 @pytest.fixture
 def repo_temp_dir():
     """Return a unique per-test directory under repository temp/tests/."""
@@ -5057,6 +5057,30 @@ class TestGitRepositoryPathCommands(unittest.TestCase):
             self.assertFalse(idle_file.exists())
             self.assertFalse(idle_dir.exists())
 
+    def test_uninstall_on_linux_removes_construct_cache(self) -> None:
+        """SRS-346, SRS-375: Linux uninstall removes constructs.sqlite and empty ~/.cache/usereq."""
+        with tempfile.TemporaryDirectory() as temp_home:
+            cache_dir = Path(temp_home) / ".cache" / "usereq"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            idle_file = cache_dir / "check_version_idle-time.json"
+            construct_cache_file = cache_dir / "constructs.sqlite"
+            idle_file.write_text("{}", encoding="utf-8")
+            construct_cache_file.write_bytes(b"")
+
+            with (
+                patch("platform.system", return_value="Linux"),
+                patch("usereq.cli.Path.home", return_value=Path(temp_home)),
+                patch("usereq.cli.subprocess.run", autospec=True) as mocked_run,
+            ):
+                mocked_run.return_value = subprocess.CompletedProcess(
+                    args=[], returncode=0
+                )
+                cli.run_uninstall()
+
+            self.assertFalse(construct_cache_file.exists())
+            self.assertFalse(idle_file.exists())
+            self.assertFalse(cache_dir.exists())
+
     def test_uninstall_on_linux_keeps_cache_dir_when_not_empty(self) -> None:
         """SRS-346: Linux uninstall keeps ~/.cache/usereq when non-idle files remain."""
         with tempfile.TemporaryDirectory() as temp_home:
@@ -0,0 +1,159 @@
+"""Tests for the usereq.construct_cache module.
+
+Covers: persistent analyzer-result cache used by find_constructs.
+"""
+
+import pickle
+import sqlite3
+
+from usereq import construct_cache
+from usereq.construct_cache import (
+    content_digest,
+    load_cached_elements,
+    prune_cached_elements,
+    store_cached_elements,
+)
+from usereq.find_constructs import find_constructs_in_files
+from usereq.source_analyzer import ElementType, SourceAnalyzer, SourceElement
+
+
+def _element(name: str) -> SourceElement:
+    """Build a minimal FUNCTION element for round-trip checks."""
+    return SourceElement(
+        element_type=ElementType.FUNCTION,
+        line_start=1,
+        line_end=2,
+        extract=f"def {name}():",
+        name=name,
+        body_comments=[(2, 2, "# note")],
+    )
+
+
+def _row_count(cache_path) -> int:
+    """Return the number of cached rows in the database."""
+    conn = sqlite3.connect(cache_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM elements").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestConstructCache:
+    """Round-trip, keying, and failure handling of the SQLite cache."""
+
+    def test_missing_database_is_a_miss(self, tmp_path):
+        """Lookup on a missing database must return None without creating it."""
+        cache_path = tmp_path / "constructs.sqlite"
+        assert load_cached_elements(content_digest("x = 1\n"), "python", "a.py", cache_path=cache_path) is None
+        assert not cache_path.exists()
+
+    def test_store_then_load_round_trip(self, tmp_path):
+        """Stored elements must be returned for identical path, text and language only."""
+        cache_path = tmp_path / "constructs.sqlite"
+        source = "def foo(): pass\n"
+        store_cached_elements(content_digest(source), "python", [_element("foo")], "a.py", cache_path=cache_path)
+
+        loaded = load_cached_elements(content_digest(source), "python", "a.py", cache_path=cache_path)
+        assert loaded == [_element("foo")]
+        assert isinstance(loaded[0].body_comments[0], tuple)
+        assert load_cached_elements(content_digest(source), "ruby", "a.py", cache_path=cache_path) is None
+        assert load_cached_elements(content_digest(source), "python", "b.py", cache_path=cache_path) is None
+        assert load_cached_elements(content_digest("def bar(): pass\n"), "python", "a.py", cache_path=cache_path) is None
+
+    def test_edits_replace_the_file_row(self, tmp_path):
+        """Re-storing an edited file must keep a single row per path and language."""
+        cache_path = tmp_path / "constructs.sqlite"
+        for idx in range(5):
+            store_cached_elements(content_digest(f"v = {idx}\n"), "python", [_element(f"v{idx}")], "a.py", cache_path=cache_path)
+
+        assert _row_count(cache_path) == 1
+        assert load_cached_elements(content_digest("v = 4\n"), "python", "a.py", cache_path=cache_path) == [_element("v4")]
+        assert load_cached_elements(content_digest("v = 0\n"), "python", "a.py", cache_path=cache_path) is None
+
+    def test_analyzer_change_invalidates_entries(self, tmp_path, monkeypatch):
+        """A different analyzer signature must miss, and pruning must drop the stale rows."""
+        cache_path = tmp_path / "constructs.sqlite"
+        source_file = tmp_path / "a.py"
+        source_file.write_text("a\n")
+        store_cached_elements(content_digest("a\n"), "python", [_element("a")], str(source_file), cache_path=cache_path)
+
+        monkeypatch.setattr(construct_cache, "analyzer_signature", lambda: "other")
+        assert load_cached_elements(content_digest("a\n"), "python", str(source_file), cache_path=cache_path) is None
+        prune_cached_elements(cache_path=cache_path)
+
+        assert _row_count(cache_path) == 0
+
+    def test_prune_evicts_rows_of_missing_files(self, tmp_path):
+        """Rows whose source file no longer exists must be removed by pruning."""
+        cache_path = tmp_path / "constructs.sqlite"
+        kept = tmp_path / "kept.py"
+        gone = tmp_path / "gone.py"
+        kept.write_text("k\n")
+        gone.write_text("g\n")
+        store_cached_elements(content_digest("k\n"), "python", [_element("k")], str(kept), cache_path=cache_path)
+        store_cached_elements(content_digest("g\n"), "python", [_element("g")], str(gone), cache_path=cache_path)
+        gone.unlink()
+
+        prune_cached_elements(cache_path=cache_path)
+
+        assert _row_count(cache_path) == 1
+        assert load_cached_elements(content_digest("k\n"), "python", str(kept), cache_path=cache_path) == [_element("k")]
+
+    def test_prune_caps_size_by_least_recent_use(self, tmp_path, monkeypatch):
+        """Pruning must keep the most recently used rows within the byte limit."""
+        cache_path = tmp_path / "constructs.sqlite"
+        clock = iter(range(1000, 2000))
+        monkeypatch.setattr(construct_cache.time, "time", lambda: float(next(clock)))
+        paths = []
+        for idx in range(4):
+            source_file = tmp_path / f"f{idx}.py"
+            source_file.write_text(f"v = {idx}\n")
+            paths.append(str(source_file))
+            store_cached_elements(content_digest(f"v = {idx}\n"), "python", [_element(f"v{idx}")], paths[-1], cache_path=cache_path)
+        row_bytes = len(pickle.dumps([_element("v0")], protocol=pickle.HIGHEST_PROTOCOL))
+
+        prune_cached_elements(cache_path=cache_path, max_bytes=2 * row_bytes)
+
+        assert _row_count(cache_path) == 2
+        assert load_cached_elements(content_digest("v = 0\n"), "python", paths[0], cache_path=cache_path) is None
+        assert load_cached_elements(content_digest("v = 3\n"), "python", paths[3], cache_path=cache_path) == [_element("v3")]
+
+    def test_prune_runs_once_per_process_and_skips_missing_database(self, tmp_path):
+        """A missing database must stay uncreated and later calls must be no-ops."""
+        cache_path = tmp_path / "constructs.sqlite"
+        prune_cached_elements(cache_path=cache_path)
+        assert not cache_path.exists()
+
+        store_cached_elements(content_digest("a\n"), "python", [_element("a")], str(tmp_path / "gone.py"), cache_path=cache_path)
+        prune_cached_elements(cache_path=cache_path)
+        assert _row_count(cache_path) == 1
+
+    def test_old_schema_is_recreated(self, tmp_path):
+        """A database written with a previous schema must be rebuilt, not left unusable."""
+        cache_path = tmp_path / "constructs.sqlite"
+        conn = sqlite3.connect(cache_path)
+        conn.execute("CREATE TABLE elements (sha256 TEXT, language TEXT, analyzer_version TEXT, file_path TEXT, pickled_elements BLOB)")
+        conn.commit()
+        conn.close()
+
+        store_cached_elements(content_digest("a\n"), "python", [_element("a")], "a.py", cache_path=cache_path)
+        assert load_cached_elements(content_digest("a\n"), "python", "a.py", cache_path=cache_path) == [_element("a")]
+
+    def test_corrupt_database_is_ignored(self, tmp_path):
+        """A non-SQLite file at the cache path must not raise on load or store."""
+        cache_path = tmp_path / "constructs.sqlite"
+        cache_path.write_bytes(b"not a database")
+        store_cached_elements(content_digest("a\n"), "python", [_element("a")], "a.py", cache_path=cache_path)
+        assert load_cached_elements(content_digest("a\n"), "python", "a.py", cache_path=cache_path) is None
+
+    def test_find_reuses_cached_analysis(self, repo_temp_dir, monkeypatch):
+        """A second find run on unchanged content must not invoke SourceAnalyzer."""
+        test_file = repo_temp_dir / "cached.py"
+        test_file.write_text("def foo():\n    return 1\n")
+        first = find_constructs_in_files([str(test_file)], "FUNCTION", "foo")
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("analyzer must not run on cache hit")
+
+        monkeypatch.setattr(SourceAnalyzer, "analyze", _fail)
+        assert find_constructs_in_files([str(test_file)], "FUNCTION", "foo") == first
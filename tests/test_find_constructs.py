@@ -3,6 +3,7 @@
 @details Tests construct extraction, tag filtering, pattern matching, and output formatting for the find_constructs module.
 """
 
+import re
 import sys
 from pathlib import Path
 
@@ -11,8 +12,11 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+import usereq.find_constructs as find_constructs_module
 from usereq.find_constructs import (
     LANGUAGE_TAGS,
+    _SourceText,
+    _extract_literal_prefix,
     construct_matches,
     find_constructs_in_files,
     format_available_tags,
@@ -20,7 +24,7 @@ from usereq.find_constructs import (
     language_supports_tags,
     parse_tag_filter,
 )
-from usereq.source_analyzer import ElementType, SourceElement
+from usereq.source_analyzer import ElementType, SourceAnalyzer, SourceElement
 
 
 def test_parse_tag_filter():
@@ -51,10 +55,10 @@ def test_construct_matches():
         name="test_foo",
     )
 
-    assert construct_matches(elem, {"FUNCTION"}, "test_.*")
-    assert construct_matches(elem, {"FUNCTION", "CLASS"}, "test_.*")
-    assert not construct_matches(elem, {"CLASS"}, "test_.*")
-    assert not construct_matches(elem, {"FUNCTION"}, "^bar$")
+    assert construct_matches(elem, {"FUNCTION"}, re.compile("test_.*"))
+    assert construct_matches(elem, {"FUNCTION", "CLASS"}, re.compile("test_.*"))
+    assert not construct_matches(elem, {"CLASS"}, re.compile("test_.*"))
+    assert not construct_matches(elem, {"FUNCTION"}, re.compile("^bar$"))
 
     # Test without name
     elem_no_name = SourceElement(
@@ -63,7 +67,7 @@ def test_construct_matches():
         line_end=1,
         extract="# comment",
     )
-    assert not construct_matches(elem_no_name, {"COMMENT"}, ".*")
+    assert not construct_matches(elem_no_name, {"COMMENT"}, re.compile(".*"))
 
 
     def test_format_construct_with_line_numbers():
@@ -224,6 +228,126 @@ def test_find_constructs_progress_with_verbose(repo_temp_dir, capsys):
     assert "Found:" in captured.err
 
 
+def test_find_constructs_progress_streams_per_file(repo_temp_dir, monkeypatch, capsys):
+    """! @brief Test that each progress line is printed before the next file is analyzed."""
+    first = repo_temp_dir / "first.py"
+    first.write_text("def foo():\n    pass\n")
+    second = repo_temp_dir / "second.py"
+    second.write_text("def foo():\n    pass\n")
+
+    stderr_before_second = []
+    original = find_constructs_module._find_constructs_in_file
+
+    def _recording(fpath, *args):
+        if fpath == str(second):
+            stderr_before_second.append(capsys.readouterr().err)
+        return original(fpath, *args)
+
+    monkeypatch.setattr(find_constructs_module, "_find_constructs_in_file", _recording)
+    find_constructs_in_files([str(first), str(second)], "FUNCTION", "foo", verbose=True)
+
+    assert stderr_before_second == [f"  OK    {first} (1 matches)\n"]
+
+
+def test_find_constructs_parallel_matches_serial(repo_temp_dir, monkeypatch, capsys):
+    """! @brief Test that pooled per-file analysis preserves serial output and progress order."""
+    files = []
+    for idx in range(4):
+        test_file = repo_temp_dir / f"mod{idx}.py"
+        test_file.write_text(f"def foo_{idx}():\n    pass\n")
+        files.append(str(test_file))
+    files.insert(2, str(repo_temp_dir / "missing.py"))
+
+    monkeypatch.setattr("usereq.find_constructs._PARALLEL_MIN_FILES", len(files) + 1)
+    serial = find_constructs_in_files(files, "FUNCTION", "^foo_", verbose=True)
+    serial_err = capsys.readouterr().err
+
+    monkeypatch.setattr("usereq.find_constructs._PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr("usereq.find_constructs.os.cpu_count", lambda: 2)
+    parallel = find_constructs_in_files(files, "FUNCTION", "^foo_", verbose=True)
+    parallel_err = capsys.readouterr().err
+
+    assert parallel == serial
+    assert parallel_err == serial_err
+    assert parallel.index("foo_0") < parallel.index("foo_3")
+    assert "SKIP  " in parallel_err and "(not found)" in parallel_err
+
+
+
+def test_find_constructs_falls_back_when_pool_unavailable(repo_temp_dir, monkeypatch, capsys):
+    """! @brief Test that a platform without process-pool support degrades to serial analysis."""
+    files = []
+    for idx in range(3):
+        test_file = repo_temp_dir / f"mod{idx}.py"
+        test_file.write_text(f"def foo_{idx}():\n    pass\n")
+        files.append(str(test_file))
+
+    monkeypatch.setattr("usereq.find_constructs._PARALLEL_MIN_FILES", len(files) + 1)
+    serial = find_constructs_in_files(files, "FUNCTION", "^foo_", verbose=True)
+    serial_err = capsys.readouterr().err
+
+    def _unavailable(*_args, **_kwargs):
+        raise NotImplementedError("no named semaphores")
+
+    monkeypatch.setattr(find_constructs_module, "ProcessPoolExecutor", _unavailable)
+    monkeypatch.setattr("usereq.find_constructs._PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr("usereq.find_constructs.os.cpu_count", lambda: 2)
+    fallback = find_constructs_in_files(files, "FUNCTION", "^foo_", verbose=True)
+
+    assert fallback == serial
+    assert capsys.readouterr().err == serial_err
+
+def test_extract_literal_prefix():
+    """! @brief Verify only literals required by every match are used for prefiltering."""
+    assert _extract_literal_prefix(re.compile("^parse_args$")) == "parse_args"
+    assert _extract_literal_prefix(re.compile("test_.*")) == "test_"
+    assert _extract_literal_prefix(re.compile("ab?c")) == "a"
+    assert _extract_literal_prefix(re.compile("ab+")) == "ab"
+    assert _extract_literal_prefix(re.compile("foo|bar")) is None
+    assert _extract_literal_prefix(re.compile("(?i)foo")) is None
+    assert _extract_literal_prefix(re.compile("foo", re.IGNORECASE)) is None
+    assert _extract_literal_prefix(re.compile(".*")) is None
+
+
+def test_find_constructs_prefilter_skips_analysis(repo_temp_dir, monkeypatch, capsys):
+    """! @brief Files lacking the pattern literal are skipped without running the analyzer."""
+    hit_file = repo_temp_dir / "hit.py"
+    hit_file.write_text("def wanted_name():\n    pass\n")
+    miss_file = repo_temp_dir / "miss.py"
+    miss_file.write_text("def other():\n    pass\n")
+
+    analyzed = []
+    original_analyze = SourceAnalyzer.analyze
+
+    def _tracking_analyze(self, filepath, language):
+        analyzed.append(filepath)
+        return original_analyze(self, filepath, language)
+
+    monkeypatch.setattr(SourceAnalyzer, "analyze", _tracking_analyze)
+    output = find_constructs_in_files(
+        [str(hit_file), str(miss_file)], "FUNCTION", "^wanted_", verbose=True
+    )
+
+    assert "wanted_name" in output
+    assert analyzed == [str(hit_file)]
+    assert f"SKIP  {miss_file} (no matches)" in capsys.readouterr().err
+
+
+
+def test_find_constructs_prefilter_falls_back_when_mmap_fails(repo_temp_dir, monkeypatch):
+    """! @brief Files that cannot be memory-mapped are still read and analyzed."""
+    test_file = repo_temp_dir / "unmappable.py"
+    test_file.write_text("def wanted_name():\n    pass\n")
+
+    def _unmappable(*_args, **_kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr(find_constructs_module.mmap, "mmap", _unmappable)
+    assert find_constructs_module._file_contains_literal(str(test_file), "absent") is True
+    output = find_constructs_in_files([str(test_file)], "FUNCTION", "^wanted_")
+
+    assert "wanted_name" in output
+
 def test_language_tags_completeness():
     """! @brief Test that all required languages have tag definitions."""
     required_languages = [
@@ -357,6 +481,22 @@ def test_format_construct_strips_comments_and_keeps_doxygen_fields():
     assert "return result;" in output
 
 
+def test_source_text_slices_match_readlines(repo_temp_dir):
+    """! @brief Verify the lazy line view slices exactly like a readlines() list."""
+    test_file = repo_temp_dir / "sample.py"
+    test_file.write_text("a = 1\n\nb = '\x0c'\r\nc = 3")
+    with open(test_file, "r", encoding="utf-8") as f:
+        expected = f.readlines()
+    with open(test_file, "r", encoding="utf-8") as f:
+        view = _SourceText(f.read())
+
+    for start in range(0, len(expected) + 2):
+        for stop in range(start, len(expected) + 3):
+            assert view[start:stop] == expected[start:stop]
+    assert view[1:] == expected[1:]
+    assert view[-2:] == expected[-2:]
+
+
 def test_format_construct_preserves_absolute_line_numbers_after_comment_strip():
     """! @brief Verify line-number prefixes map to original file lines after stripping comments."""
     elem = SourceElement(
@@ -747,8 +747,8 @@ class TestFindConstructsComprehensive:
         """! @brief Test that invalid regex patterns are handled gracefully."""
         fixture = str(self.get_fixture_path(fixtures_dir, "python"))
 
-        # Invalid regex should result in no matches
-        with pytest.raises(ValueError, match="No constructs found"):
+        # Invalid regex is rejected before any file is analyzed
+        with pytest.raises(ValueError, match="Invalid regex pattern"):
             find_constructs_in_files([fixture], "CLASS", "[invalid(regex")
 
 
@@ -549,7 +549,10 @@ class TestOnlineUpdateCheck(unittest.TestCase):
     def test_uninstall_command_uses_tool_program_name(self) -> None:
         """Uninstall command must target configured tool program name."""
         result_mock = MagicMock(returncode=0)
-        with patch("usereq.cli.subprocess.run", return_value=result_mock) as run_mock:
+        with (
+            patch("usereq.cli.subprocess.run", return_value=result_mock) as run_mock,
+            patch("usereq.cli.cleanup_release_check_idle_state_cache"),
+        ):
             cli.run_uninstall()
 
         run_mock.assert_called_once_with(